@@ -1,3 +1,3 @@
-from ._core import clear_cache, fetch
+from ._core import clear_cache, clear_memcache, fetch
 
-__all__ = ["fetch", "clear_cache"]
+__all__ = ["fetch", "clear_cache", "clear_memcache"]
@@ -1,11 +1,23 @@
 """Constants to be used in the core module."""
 
+import struct
+
 import polars as pl
 
 LOCAL_CACHE_DIR = ".monthly_candles"
 
+CACHE_TTL_SECONDS = 3600  # Lifetime of a cache file holding a partial month
+
+MONTH_SETTLE_SECONDS = 86400  # Publishing lag after a month has ended
+
 BINANCE_KLINE_URL = "https://data.binance.vision/data/spot/monthly/klines"
 
+MAX_DOWNLOAD_WORKERS = 16
+
+DOWNLOAD_TIMEOUT = (5, 60)  # (connect, read) in seconds
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 BINANCE_KLINE_SCHEMA = {
     "timestamp": pl.Int64,
     "open": pl.Float64,
@@ -22,3 +34,10 @@ BINANCE_KLINE_SCHEMA = {
 }
 
 OHLCV_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+# Signature, version, flags, method, time, date, CRC-32, compressed size,
+# uncompressed size, file name length and extra field length
+ZIP_LOCAL_FILE_HEADER = struct.Struct("<4s5H3L2H")
+
+# General purpose flag set when the CRC-32 and sizes follow the file data
+ZIP_FLAG_DATA_DESCRIPTOR = 0x08
@@ -3,22 +3,60 @@
 import io
 import os
 import shutil
+import time
 import zipfile
-from datetime import datetime
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 import polars as pl
 import requests
 from dateutil.relativedelta import relativedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from monthly_candles._constants import (
     BINANCE_KLINE_SCHEMA,
     BINANCE_KLINE_URL,
+    CACHE_TTL_SECONDS,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_TIMEOUT,
     LOCAL_CACHE_DIR,
+    MAX_DOWNLOAD_WORKERS,
+    MONTH_SETTLE_SECONDS,
     OHLCV_COLUMNS,
+    ZIP_FLAG_DATA_DESCRIPTOR,
+    ZIP_LOCAL_FILE_HEADER,
 )
 
-__all__ = ["clear_cache", "fetch"]
+__all__ = ["clear_cache", "clear_memcache", "fetch"]
+
+
+def _create_session() -> requests.Session:
+    """Creates a session that reuses connections and retries failed requests.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=MAX_DOWNLOAD_WORKERS,
+        pool_maxsize=MAX_DOWNLOAD_WORKERS,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all downloads so connections are kept alive between months
+_SESSION = _create_session()
 
 
 def _construct_url(symbol: str, timeframe: str, month: str) -> str:
@@ -36,80 +74,162 @@ def _construct_url(symbol: str, timeframe: str, month: str) -> str:
     return f"{BINANCE_KLINE_URL}/{symbol}/{timeframe}/{file_name}"
 
 
-def _download_zip_file(url: str) -> io.BytesIO:
+def _read_response_body(response: requests.Response) -> io.BytesIO:
+    """Reads a streamed response body into a BytesIO object.
+
+    Args:
+        response (requests.Response): The streamed response.
+
+    Returns:
+        io.BytesIO: The response body as a BytesIO object.
+    """
+    content = io.BytesIO()
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        content.write(chunk)
+    content.seek(0)
+    return content
+
+
+def _download_zip_file(
+    url: str,
+    etag: Optional[str] = None,
+) -> tuple[Optional[io.BytesIO], Optional[str]]:
     """Downloads a zip file from the given URL.
 
     Args:
         url (str): The URL of the zip file.
+        etag (Optional[str]): The ETag of a previously downloaded copy. If
+            given, the download is skipped when the file has not changed.
 
     Returns:
-        io.BytesIO: The downloaded zip file content as a BytesIO object.
+        tuple[Optional[io.BytesIO], Optional[str]]: The downloaded zip file
+            content as a BytesIO object, or None if it was not modified, and
+            the ETag of the file.
     """
+    headers = {"If-None-Match": etag} if etag else None
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        return io.BytesIO(response.content)
+        with _SESSION.get(
+            url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            if response.status_code == requests.codes.not_modified:
+                return None, etag
+            return _read_response_body(response), response.headers.get("ETag")
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Error fetching data from {url}: {e}")
 
 
-def _extract_csv_from_zip(zip_content: io.BytesIO) -> io.TextIOWrapper:
+def _extract_csv_from_zip(zip_content: io.BytesIO) -> bytes:
     """Extracts the first CSV file from the zip content.
 
     Args:
         zip_content (io.BytesIO): The content of the zip file.
 
     Returns:
-        io.TextIOWrapper: A file-like object for the extracted CSV file.
+        bytes: The raw content of the extracted CSV file.
     """
+    # Binance archives hold a single deflated CSV, so inflate it directly
+    # from behind its local file header and only fall back to zipfile for
+    # any other layout, or if the inflated data fails its CRC-32 check
+    buffer = zip_content.getbuffer()
+    if len(buffer) >= ZIP_LOCAL_FILE_HEADER.size:
+        signature, _, flags, method, _, _, crc, *_, name_length, extra_length = (
+            ZIP_LOCAL_FILE_HEADER.unpack_from(buffer)
+        )
+        if signature == b"PK\x03\x04" and method == zipfile.ZIP_DEFLATED:
+            offset = ZIP_LOCAL_FILE_HEADER.size + name_length + extra_length
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            csv_bytes = decompressor.decompress(buffer[offset:])
+            if flags & ZIP_FLAG_DATA_DESCRIPTOR:
+                # The CRC-32 follows the deflate stream, optionally signed
+                descriptor = decompressor.unused_data
+                if descriptor[:4] == b"PK\x07\x08":
+                    descriptor = descriptor[4:]
+                crc = int.from_bytes(descriptor[:4], "little")
+            if decompressor.eof and zlib.crc32(csv_bytes) == crc:
+                return csv_bytes
+
     with zipfile.ZipFile(zip_content) as z:
         csv_file_name = z.namelist()[0]  # Assuming there's only one file
-        return io.TextIOWrapper(z.open(csv_file_name), encoding="utf-8")
+        return z.read(csv_file_name)
 
 
-def _csv_to_dataframe(csv_file: io.TextIOWrapper) -> pl.DataFrame:
-    """Reads a CSV file-like object into a Polars DataFrame.
+def _csv_to_dataframe(csv_bytes: bytes) -> pl.DataFrame:
+    """Reads raw CSV content into a Polars DataFrame.
 
     Args:
-        csv_file (io.TextIOWrapper): A file-like object for the CSV file.
+        csv_bytes (bytes): The raw content of the CSV file.
 
     Returns:
         pl.DataFrame: The OHLCV data as a Polars DataFrame.
     """
-    df = pl.read_csv(csv_file, has_header=False, schema=BINANCE_KLINE_SCHEMA)
-    df = df.with_columns(pl.col("timestamp").cast(pl.Datetime("ms")))
-    return df.select(OHLCV_COLUMNS)  # Keep OHLCV columns only
+    # Scan lazily so only the OHLCV columns are parsed, converting the epoch
+    # timestamps as part of the same projection
+    return (
+        pl.scan_csv(csv_bytes, has_header=False, schema=BINANCE_KLINE_SCHEMA)
+        .select(
+            pl.col("timestamp").cast(pl.Datetime("ms")),
+            *OHLCV_COLUMNS[1:],
+        )
+        .collect()
+    )
 
 
-def _add_missing_timestamps(
-    df: pl.DataFrame,
-    timeframe: str,
-    month: str,
-) -> pl.DataFrame:
-    """Adds any missing timestamps in the DataFrame.
+@lru_cache(maxsize=32)
+def _get_month_timestamps(timeframe: str, month: str) -> pl.Series:
+    """Returns every candle timestamp of a month.
+
+    The result is cached, as it is identical for every symbol.
 
     Args:
-        df (pl.DataFrame): The input DataFrame.
         timeframe (str): The timeframe (e.g., "1m").
         month (str): The month in "YYYY-MM" format (e.g., "2024-12").
 
     Returns:
-        pl.DataFrame: The DataFrame with filled timestamps.
+        pl.Series: The timestamps of the month.
     """
     start = datetime.strptime(month, "%Y-%m")
     end = start + relativedelta(months=1)
 
-    timestamp_range = pl.datetime_range(
+    return pl.datetime_range(
         start=start,
         end=end,
         interval=timeframe,
         time_unit="ms",
         closed="left",
         eager=True,
-    )
-    timestamps = pl.DataFrame({"timestamp": timestamp_range})
+    ).alias("timestamp")
 
-    return timestamps.join(df, on="timestamp", how="left")
+
+def _add_missing_timestamps(
+    df: pl.DataFrame,
+    timeframe: str,
+    month: str,
+) -> pl.DataFrame:
+    """Adds any missing timestamps in the DataFrame.
+
+    Args:
+        df (pl.DataFrame): The input DataFrame.
+        timeframe (str): The timeframe (e.g., "1m").
+        month (str): The month in "YYYY-MM" format (e.g., "2024-12").
+
+    Returns:
+        pl.DataFrame: The DataFrame with filled timestamps.
+    """
+    timestamps = _get_month_timestamps(timeframe, month)
+
+    # Upsampling only fills gaps between the first and last candle, so use it
+    # when both ends of the month are present
+    df = df.sort("timestamp")
+    if df.height > 0:
+        first, last = df["timestamp"].first(), df["timestamp"].last()
+        if first == timestamps.first() and last == timestamps.last():
+            # Most months are complete, in which case there is nothing to fill
+            if df["timestamp"].equals(timestamps):
+                return df
+            return df.upsample(time_column="timestamp", every=timeframe)
+
+    return timestamps.to_frame().join(df, on="timestamp", how="left")
 
 
 def _add_symbol_column(df: pl.DataFrame, symbol: str) -> pl.DataFrame:
@@ -126,22 +246,55 @@ def _add_symbol_column(df: pl.DataFrame, symbol: str) -> pl.DataFrame:
     return df.select(["symbol"] + OHLCV_COLUMNS)
 
 
-def _get_cache_path(symbol: str, timeframe: str, month: str) -> str:
+def _get_cache_path(
+    symbol: str,
+    timeframe: str,
+    month: str,
+    partial: bool = False,
+) -> str:
     """Generates a file path for the cache file.
 
     Args:
         symbol (str): The trading pair symbol (e.g., "BTCUSDT").
         timeframe (str): The timeframe (e.g., "1m").
         month (str): The month in "YYYY-MM" format (e.g., "2024-12").
+        partial (bool): Whether the file holds a month that may still change.
+            Defaults to False.
 
     Returns:
         str: The cache file path.
     """
-    os.makedirs(LOCAL_CACHE_DIR, exist_ok=True)
-    filename = f"{symbol}-{timeframe}-{month}.parquet"
+    suffix = ".partial.parquet" if partial else ".parquet"
+    filename = f"{symbol}-{timeframe}-{month}{suffix}"
     return os.path.join(LOCAL_CACHE_DIR, filename)
 
 
+def _get_month_settled_time(month: str) -> float:
+    """Returns the time after which the data of a month no longer changes.
+
+    Args:
+        month (str): The month in "YYYY-MM" format (e.g., "2024-12").
+
+    Returns:
+        float: The end of the month plus a publishing lag, as a timestamp.
+    """
+    start = datetime.strptime(month, "%Y-%m").replace(tzinfo=timezone.utc)
+    end = start + relativedelta(months=1)
+    return end.timestamp() + MONTH_SETTLE_SECONDS
+
+
+def _is_cache_fresh(cache_path: str) -> bool:
+    """Checks whether a partial month cache file can still be used.
+
+    Args:
+        cache_path (str): The path to the partial month cache file.
+
+    Returns:
+        bool: True if the cache file is younger than the TTL.
+    """
+    return time.time() - os.path.getmtime(cache_path) < CACHE_TTL_SECONDS
+
+
 def _load_from_cache(cache_path: str) -> pl.DataFrame:
     """Loads a Polars DataFrame from a cache file.
 
@@ -161,31 +314,95 @@ def _save_to_cache(df: pl.DataFrame, cache_path: str) -> None:
         df (pl.DataFrame): The DataFrame to save.
         cache_path (str): The path to the cache file.
     """
-    df.write_parquet(cache_path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    df.write_parquet(
+        cache_path,
+        compression="zstd",
+        compression_level=3,
+        statistics=True,
+        row_group_size=65536,
+    )
+
+
+def _get_etag_path(cache_path: str) -> str:
+    """Generates a file path for the ETag sidecar of a cache file.
+
+    Args:
+        cache_path (str): The path to the cache file.
+
+    Returns:
+        str: The ETag file path.
+    """
+    return f"{cache_path}.etag"
+
+
+def _load_etag(cache_path: str) -> str:
+    """Loads the ETag stored alongside a cache file.
+
+    Args:
+        cache_path (str): The path to the cache file.
+
+    Returns:
+        str: The stored ETag.
+    """
+    with open(_get_etag_path(cache_path)) as f:
+        return f.read()
+
+
+def _remove_etag(cache_path: str) -> None:
+    """Removes the ETag stored alongside a cache file, if any.
+
+    Args:
+        cache_path (str): The path to the cache file.
+    """
+    try:
+        os.remove(_get_etag_path(cache_path))
+    except FileNotFoundError:
+        pass
+
+
+def _save_etag(etag: Optional[str], cache_path: str) -> None:
+    """Saves the ETag alongside a cache file, or removes it if there is none.
+
+    Args:
+        etag (Optional[str]): The ETag to save.
+        cache_path (str): The path to the cache file.
+    """
+    if etag is None:
+        _remove_etag(cache_path)
+        return
+    with open(_get_etag_path(cache_path), "w") as f:
+        f.write(etag)
 
 
 def _fetch_data_from_source(
     symbol: str,
     timeframe: str,
     month: str,
-) -> pl.DataFrame:
+    etag: Optional[str] = None,
+) -> tuple[Optional[pl.DataFrame], Optional[str]]:
     """Loads data from the source and returns it as a Polars DataFrame.
 
     Args:
         symbol (str): The trading pair symbol (e.g., "BTCUSDT").
         timeframe (str): The timeframe (e.g., "1m").
         month (str): The month in "YYYY-MM" format (e.g., "2024-12").
+        etag (Optional[str]): The ETag of a previously downloaded copy.
 
     Returns:
-        pl.DataFrame: The OHLCV data as a Polars DataFrame.
+        tuple[Optional[pl.DataFrame], Optional[str]]: The OHLCV data as a
+            Polars DataFrame, or None if it was not modified, and the ETag
+            of the source file.
     """
     url = _construct_url(symbol, timeframe, month)
-    zip_content = _download_zip_file(url)
-    csv_file = _extract_csv_from_zip(zip_content)
-    df = _csv_to_dataframe(csv_file)
+    zip_content, etag = _download_zip_file(url, etag)
+    if zip_content is None:
+        return None, etag
+    csv_bytes = _extract_csv_from_zip(zip_content)
+    df = _csv_to_dataframe(csv_bytes)
     df = _add_missing_timestamps(df, timeframe, month)
     df = _add_symbol_column(df, symbol)
-    return df
+    return df, etag
 
 
 def _fetch_monthly_candles(
@@ -206,21 +423,67 @@ def _fetch_monthly_candles(
         pl.DataFrame: The OHLCV data as a Polars DataFrame.
     """
     cache_path = _get_cache_path(symbol, timeframe, month)
+    partial_path = _get_cache_path(symbol, timeframe, month, partial=True)
+    has_partial = False
+    cached_etag = None
 
-    # Load from cache if enabled and available
-    if use_cache and os.path.exists(cache_path):
-        return _load_from_cache(cache_path)
+    # Load from cache if enabled and available. A final file never changes,
+    # while a partial month is reused within its TTL and revalidated after
+    if use_cache:
+        try:
+            return _load_from_cache(cache_path)
+        except FileNotFoundError:
+            pass
+        try:
+            if _is_cache_fresh(partial_path):
+                return _load_from_cache(partial_path)
+            has_partial = True
+            cached_etag = _load_etag(partial_path)
+        except FileNotFoundError:
+            pass
 
     # Fetch data from source
-    df = _fetch_data_from_source(symbol, timeframe, month)
+    df, etag = _fetch_data_from_source(symbol, timeframe, month, cached_etag)
+
+    # Data fetched after the month settled is final and is never revalidated
+    settled = time.time() >= _get_month_settled_time(month)
+
+    # Reuse the partial cache if the source has not changed since it was saved
+    if df is None:
+        if settled:
+            os.replace(partial_path, cache_path)
+            _remove_etag(partial_path)
+            return _load_from_cache(cache_path)
+        os.utime(partial_path)  # Restart the TTL of the cache file
+        return _load_from_cache(partial_path)
 
     # Save to cache if enabled
     if use_cache:
-        _save_to_cache(df, cache_path)
+        if settled:
+            _save_to_cache(df, cache_path)
+            if has_partial:
+                os.remove(partial_path)
+                _remove_etag(partial_path)
+        else:
+            _save_to_cache(df, partial_path)
+            _save_etag(etag, partial_path)
 
     return df
 
 
+@lru_cache(maxsize=512)
+def _load_memoized_from_cache(cache_path: str) -> pl.DataFrame:
+    """Loads a final cache file, memoized for the process lifetime.
+
+    Args:
+        cache_path (str): The path to the final cache file.
+
+    Returns:
+        pl.DataFrame: The cached DataFrame.
+    """
+    return _load_from_cache(cache_path)
+
+
 def _get_months(start: str, end: Optional[str] = None) -> list[str]:
     """Returns a list of months between a start and end date.
 
@@ -235,14 +498,11 @@ def _get_months(start: str, end: Optional[str] = None) -> list[str]:
     start_date = datetime.strptime(start, "%Y-%m")
     end_date = datetime.strptime(end, "%Y-%m") if end else start_date
 
-    months = []
-    current_date = start_date
+    # Count months since year 0 so the range is plain integer arithmetic
+    first = start_date.year * 12 + start_date.month - 1
+    last = end_date.year * 12 + end_date.month - 1
 
-    while current_date <= end_date:
-        months.append(current_date.strftime("%Y-%m"))
-        current_date += relativedelta(months=1)
-
-    return months
+    return [f"{i // 12:04d}-{i % 12 + 1:02d}" for i in range(first, last + 1)]
 
 
 def fetch(
@@ -251,6 +511,8 @@ def fetch(
     start: str,
     end: Optional[str] = None,
     use_cache: bool = True,
+    memoize: bool = False,
+    rechunk: bool = False,
 ) -> pl.DataFrame:
     """Returns multiple months of candles as a Polars DataFrame.
 
@@ -261,6 +523,11 @@ def fetch(
         end (Optional[str]): End month in "YYYY-MM" format (e.g., "2023-12").
             If None, only the start month is returned.
         use_cache (bool): Whether to use cache. Defaults to True.
+        memoize (bool): Whether to also keep fetched months in memory for
+            the lifetime of the process; requires use_cache. Defaults to
+            False.
+        rechunk (bool): Whether to copy the months into contiguous memory.
+            Defaults to False.
 
     Returns:
         pl.DataFrame: The OHLCV data as a Polars DataFrame.
@@ -269,18 +536,43 @@ def fetch(
         symbols = [symbols]
 
     months = _get_months(start, end)
-    candles = []
-
-    for symbol in symbols:
-        for month in months:
-            candles.append(
-                _fetch_monthly_candles(symbol, timeframe, month, use_cache)
-            )
-
-    return pl.concat(candles, how="vertical")
+    tasks = [(symbol, month) for symbol in symbols for month in months]
+    if not tasks:
+        raise ValueError(
+            f"Nothing to fetch for symbols {symbols} between {start} and "
+            f"{end or start}; provide at least one symbol and an end month "
+            "that is not before the start month"
+        )
+
+    def fetch_month(task: tuple[str, str]) -> pl.DataFrame:
+        symbol, month = task
+        # Only final cache files are memoized, as partial months still change
+        if use_cache and memoize:
+            cache_path = _get_cache_path(symbol, timeframe, month)
+            try:
+                # Hand out a clone, which shares the buffers, so that in-place
+                # changes by the caller never reach the memoized frame
+                return _load_memoized_from_cache(cache_path).clone()
+            except FileNotFoundError:
+                pass
+        return _fetch_monthly_candles(symbol, timeframe, month, use_cache)
+
+    # Downloads are network-bound, so fetch months concurrently; `map` keeps
+    # the results in task order, which keeps the concatenation deterministic
+    max_workers = min(MAX_DOWNLOAD_WORKERS, len(tasks))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        candles = list(executor.map(fetch_month, tasks))
+
+    return pl.concat(candles, how="vertical", rechunk=rechunk)
 
 
 def clear_cache() -> None:
     """Clears the cache directory."""
     if os.path.exists(LOCAL_CACHE_DIR):
         shutil.rmtree(LOCAL_CACHE_DIR)
+
+
+def clear_memcache() -> None:
+    """Clears the in-memory cache of previously fetched months."""
+    _load_memoized_from_cache.cache_clear()
+    _get_month_timestamps.cache_clear()